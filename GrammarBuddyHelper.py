@@ -1,277 +1,558 @@
-"""Backus-Naur Form Tool
-
-This class allows the user to instantiate a GrammarBuddyHelper object which allows
-the creation of grammar using Backus-Naur Form notation. It is assumed that the 
-the rules of the grammar are compiled within a list with each definition constituting a line.
-
-This class accepts text files (.txt) and the default save location is within BNF Forms/grammar.txt.
-
-...
-
-Attributes
-----------
-rules : str[]
-    every definition of each symbol within the grammar as a list with the structure ['symbol symDelim expression', ...]
-langMap : {str : str[]}
-    a dictionary of the grammar which is in the form of {symbol : [expression, ...], ...}
-symDelim : str
-    the syntax used to delimit the symbols from the expressions (default ::=)
-exprDelim : str
-    the syntax used to delimit the expressions from each other (default |)
-
-Methods
--------
-generate(symbol)
-    this function generates an expression given a symbol
-contains(term)
-    this function determines whether or not a given term is either a symbol or expression
-addSymbol(symbol)
-    this function determines whether or not a symbol is within the grammar and adds it if not
-addExpression(symbol, expression)
-    this function determines whether or not an expression represents a symbol and adds the expression if not
-saveMap(filename='BNF Forms/grammar.txt')
-    this function saves the current grammar as a text file
-Written by Kody L. Robinson 2025
-"""
-import random, sys
-import pyinputplus as pyip
-
-class GrammarBuddyHelper:
-    def __init__(self, rules, symDelim='::=', exprDelim='|'):
-        """
-        This is the default constructor, custom delimiters can be used with '::=' and '|' 
-        representing the default delimiters for the symbols and expressions respectively
-        ...
-
-        Parameters
-        ----------
-        rules : str[]
-            every definition of each symbol within the grammar as a list with the structure ['symbol symDelim expression', ...]
-        symDelim : str
-            the syntax used to delimit the symbols from the expressions (default ::=)
-        exprDelim : str
-            the syntax used to delimit the expressions from each other (default |)
-
-        Returns
-        ----------
-        langMap : { str: str[] }
-            a dictionary of the grammar which is in the form of { symbol : [expression] }
-            
-        """
-        if not rules:
-            print("!WARNING: Rule set cannot be empty")
-        self.symDelim = symDelim
-        self.exprDelim = exprDelim
-        self.langMap = {}
-        for i in rules:
-            if symDelim not in i:
-                print("Malformed rule: " + i)
-                return
-            line = i.split(symDelim)
-            expressions = line[1].split(exprDelim)
-            rule = {line[0]: expressions}
-            self.langMap.update(rule)
-   
-    def generate(self, symbol):
-        """
-        This method generates an expression based upon a given symbol. 
-        Returns "Symbol not found in grammar" if the given symbol is not found within the grammar
-        ...
-
-        Parameters
-        ----------
-        symbol : str
-            this is the symbol that will be substituted with a randomly selected expression
-
-        Returns
-        -------
-        term : str
-            this is the expresssion that was generated for the symbol
-        """
-        term = ''
-        if symbol not in self.langMap:
-            term = "Symbol not found in grammar: " + symbol
-            return term
-        rule = self.langMap[symbol]
-        expression = rule[random.randint(0, len(rule)-1)]
-        iterableExpressions = expression.split(' ')
-        for i in iterableExpressions:
-            if i in self.langMap:
-                term += self.generate(i).strip() + ' '
-            else:
-                term += i + ' '
-        return term
-
-    def contains(self, term):
-        """
-        This method checks whether or not a term is a symbol. If the term is not a symbol, all of the 
-        expressions of each symbol are checked
-        ...
-
-        Parameters
-        ----------
-        term : str
-            this is the given term to be searched. Can be a symbol or expression
-
-        Returns
-        -------
-        bool
-            an unnamed boolean value representing whether or not the term was found within the grammar
-        """
-        if term in self.langMap.keys():
-            return True
-        for i in self.langMap.values():
-            if term in i:
-                return True
-        return False
-
-    def addSymbol(self, symbol):
-        """
-        This method checks whether or not a given symbol is within the grammar. If not, the symbol is added
-        ...
-
-        Parameters
-        ----------
-        symbol : str
-            this is the symbol to be added
-        """
-        add = {symbol: []}
-        self.langMap.update(add)
-
-    def addExpression(self, symbol, expression):
-        """
-        This method checks whether or not a given expression is found for the given symbol. If not,
-        the symbol is defined as the expression and is saved into the grammar
-        ...
-
-        Parameters
-        ----------
-        symbol : str
-            this is the symbol in which the expression is to be added under
-        expression : str
-            this is the expression to be added 
-        """
-        if symbol in self.langMap:
-            self.langMap[symbol].append(expression)
-        else:
-            self.addSymbol(symbol)
-            self.langMap.update({symbol: [expression]})
-
-    def saveMap(self, filename='BNF Forms/grammar.txt'):
-        """
-        This method allows the grammar to be saved in a text file with each line constituting a symbol defintion
-        ...
-
-        Parameters
-        ----------
-        filename : str
-            the filename that the grammar will be saved as        
-        """
-        if '.txt' not in filename:
-            filename += '.txt'
-        with open(filename, 'w', encoding='utf-8') as file:
-            for k in self.langMap.keys():
-                line = k + self.symDelim
-                for v in self.langMap[k]:
-                    if v == self.langMap[k][-1]:
-                        line += v
-                    else:    
-                        line += v + self.exprDelim
-                file.write(line+"\n")
-        file.close()         
-
-    def updateMap(self, filename):
-        if '.txt' not in filename:
-            filename += '.txt'    
-        with open(filename, 'r', encoding='utf-8') as file:
-            for rule in file:
-                self.addSymbol(rule.strip().split(self.symDelim)[0])
-                for expr in rule.strip().split(self.symDelim)[1].split(self.exprDelim):
-                    self.addExpression(rule.strip().split(self.symDelim)[0].strip(), expr)
-
-def main():
-    rules = [] # Empty list to hold grammar
-
-    try:
-        with open("BNF Forms/math.txt", 'r') as file:
-            for line in file:
-                rules.append(line.strip())
-    except FileNotFoundError as e:
-        print(f"Uh oh\n{e}")
-    gb = GrammarBuddyHelper(rules) # Constructing GrammarBuddyHelper object
-
-    gb.addExpression('<x>','<s>') # Adding sample expression
-    for i in range(100):
-        print(f'{i+1}: {gb.generate('<expression>')}') # Generate 100 sample expressions
-    gb.saveMap("BNF Forms/testgrammar.txt") # Saving updated grammar
-
-if __name__ == "__main__":
-    rules = []
-    start = pyip.inputYesNo("Would you like to load a grammar file? Press ENTER to exit\n", blank=True) 
-    if start == 'yes':
-        while not rules:
-            filename = input("Path of grammar file? Press ENTER to skip\n")
-            if not filename:
-                break
-            try:
-                with open(filename, 'r', encoding='utf-8') as file:
-                    for line in file:
-                        rules.append(line.strip())
-                gb = GrammarBuddyHelper(rules)
-            except FileNotFoundError as e:
-                print(f"Uh oh \n{e}\n")
-    elif not start:
-        sys.exit()
-    else:
-        gb = GrammarBuddyHelper([])
-    flag = True
-    while flag:
-        choice = pyip.inputMenu(['Generate a symbol', 'Generate a number of symbols', 'List symbols', 'Add a symbol', 'Add an expression', 'Does it contain?', 'Open a grammar text file', 'Save grammar to a text file', 'Exit'], numbered=True)
-
-        match choice:
-            case 'Generate a symbol':
-                if 0 == len(gb.langMap.keys()): 
-                    print("Cannot generate a big nothing symbol!")
-                    continue
-                print("Press ENTER to skip")
-                choice = pyip.inputMenu(list(gb.langMap.keys()), numbered=True, blank=True)
-                print(gb.generate(choice))
-            case 'Generate a number of symbols':
-                if 0 == len(gb.langMap.keys()):
-                    print("Cannot generate multiple big nothing symbols!")
-                    continue
-                symbol = pyip.inputMenu(list(gb.langMap.keys()), prompt="Which symbol would you like to generate? Press ENTER to exit\n", blank=True, numbered=True)
-                if symbol: 
-                    print(f"How many {symbol}'s would you like to print?")
-                    symbols = pyip.inputNum(greaterThan=-1)
-                    for i in range(symbols):
-                        print(f"{i+1}: {gb.generate(symbol)}")
-            case 'List symbols':
-                for i in gb.langMap.keys():
-                    print(i)
-            case 'Add a symbol':
-                symbol = input("What symbol would you like to add?\n")
-                gb.addSymbol(symbol)
-            case 'Add an expression':
-                symbol = input("What symbol does this expression define?\n")
-                expression = input("What is the expression?\n")
-                gb.addExpression(symbol=symbol, expression=expression)
-            case 'Does it contain?':
-                term = input("What term would you like to check?\n")
-                print(gb.contains(term))
-            case 'Open a grammar text file':
-                filename = input("What is the name of the text file you would like to open? Press ENTER to exit\n")
-                if filename:
-                    try:
-                        gb.updateMap(filename)
-                    except Exception as e:
-                        print(f'Uh oh\n{e}')
-            case 'Save grammar to a text file':
-                filename = input("What name would you like to save the file as? Press ENTER to exit\n")
-                if filename:
-                    try:
-                        gb.saveMap(filename)
-                    except Exception as e:
-                        print(f'Uh oh \n{e}')
-            case 'Exit':
-                flag = False
+"""Backus-Naur Form Tool
+
+This class allows the user to instantiate a GrammarBuddyHelper object which allows
+the creation of grammar using Backus-Naur Form notation. It is assumed that the 
+the rules of the grammar are compiled within a list with each definition constituting a line.
+
+This class accepts text files (.txt) and the default save location is within BNF Forms/grammar.txt.
+
+...
+
+Attributes
+----------
+rules : str[]
+    every definition of each symbol within the grammar as a list with the structure ['symbol symDelim expression', ...]
+langMap : {str : str[][]}
+    a dictionary of the grammar with each expression pre-split into tokens, in the form of {symbol : [[token, ...], ...], ...}
+symDelim : str
+    the syntax used to delimit the symbols from the expressions (default ::=)
+exprDelim : str
+    the syntax used to delimit the expressions from each other (default |)
+
+Methods
+-------
+generate(symbol)
+    this function generates an expression given a symbol
+generateBulk(symbol, count)
+    this function generates many expressions for a symbol, JIT-compiled when numba is installed
+contains(term)
+    this function determines whether or not a given term is either a symbol or expression
+addSymbol(symbol)
+    this function determines whether or not a symbol is within the grammar and adds it if not
+addExpression(symbol, expression)
+    this function determines whether or not an expression represents a symbol and adds the expression if not
+fromFile(filename)
+    this classmethod constructs a GrammarBuddyHelper directly from a grammar text file
+saveMap(filename='BNF Forms/grammar.txt')
+    this function saves the current grammar as a text file
+Written by Kody L. Robinson 2025
+"""
+import random, sys
+import pyinputplus as pyip
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _expandCompiled(symId, ruleAltStart, altStart, ruleTokens, symNameIds, outBuf):
+        """
+        This function is the JIT-compiled expansion kernel behind generateBulk(). It walks the
+        flattened rule arrays with an explicit stack, writing terminal ids into outBuf and
+        returning how many were written, or -1 if outBuf was too small
+        """
+        stack = np.empty(256, np.int64)
+        stack[0] = symId
+        top = 1
+        n = 0
+        while top:
+            top -= 1
+            tokId = stack[top]
+            if tokId < 0:
+                if n >= outBuf.shape[0]:
+                    return -1
+                outBuf[n] = tokId
+                n += 1
+                continue
+            altLo = ruleAltStart[tokId]
+            altHi = ruleAltStart[tokId + 1]
+            if altLo == altHi:
+                if n >= outBuf.shape[0]:
+                    return -1
+                outBuf[n] = symNameIds[tokId]
+                n += 1
+                continue
+            alt = altLo + np.random.randint(0, altHi - altLo)
+            tokLo = altStart[alt]
+            tokHi = altStart[alt + 1]
+            if top + (tokHi - tokLo) > stack.shape[0]:
+                grown = np.empty(stack.shape[0] * 2 + (tokHi - tokLo), np.int64)
+                grown[:top] = stack[:top]
+                stack = grown
+            for i in range(tokHi - 1, tokLo - 1, -1):
+                stack[top] = ruleTokens[i]
+                top += 1
+        return n
+else:
+    _expandCompiled = None
+
+class GrammarBuddyHelper:
+    __slots__ = ('symDelim', 'exprDelim', 'langMap', '_isTerminalRule', '_terminalCache',
+                 '_exprIndex', '_symId', '_symNameId', '_terminals', '_rules',
+                 '_rngBuf', '_rngIdx', '_ruleAltStart', '_altStart', '_ruleTokens', '_symNameIds')
+
+    def __init__(self, rules, symDelim='::=', exprDelim='|'):
+        """
+        This is the default constructor, custom delimiters can be used with '::=' and '|' 
+        representing the default delimiters for the symbols and expressions respectively
+        ...
+
+        Parameters
+        ----------
+        rules : str[]
+            every definition of each symbol within the grammar as a list with the structure ['symbol symDelim expression', ...]
+        symDelim : str
+            the syntax used to delimit the symbols from the expressions (default ::=)
+        exprDelim : str
+            the syntax used to delimit the expressions from each other (default |)
+
+        Returns
+        ----------
+        langMap : { str: str[][] }
+            a dictionary of the grammar with each expression pre-split into tokens, in the form of { symbol : [[token, ...]] }
+            
+        """
+        self.symDelim = symDelim
+        self.exprDelim = exprDelim
+        self.langMap = {}
+        self._isTerminalRule = {}
+        self._terminalCache = {}
+        self._exprIndex = set()
+        self._symId = {}
+        self._symNameId = []
+        self._terminals = []
+        self._rules = []
+        self._rngBuf = {}
+        self._rngIdx = {}
+        for i in rules:
+            if symDelim not in i:
+                print("Malformed rule: " + i)
+                break
+            line = i.split(symDelim)
+            alternatives = line[1].split(exprDelim)
+            self.langMap[sys.intern(line[0])] = [[sys.intern(token) for token in alt.split(' ')] for alt in alternatives]
+        if not self.langMap:
+            print("!WARNING: Rule set cannot be empty")
+        self._checkLeftRecursion()
+        self._buildTerminalCache()
+        self._compile()
+
+    @classmethod
+    def fromFile(cls, filename, symDelim='::=', exprDelim='|'):
+        """
+        This classmethod constructs a GrammarBuddyHelper directly from a grammar text file,
+        streaming the lines into the constructor so no intermediate rules list is built
+        ...
+
+        Parameters
+        ----------
+        filename : str
+            the path of the grammar text file to load
+        symDelim : str
+            the syntax used to delimit the symbols from the expressions (default ::=)
+        exprDelim : str
+            the syntax used to delimit the expressions from each other (default |)
+
+        Returns
+        -------
+        GrammarBuddyHelper
+            a helper loaded with the grammar from the file
+        """
+        with open(filename, 'r', encoding='utf-8') as file:
+            return cls((line.rstrip('\r\n') for line in file), symDelim, exprDelim)
+
+    def _checkLeftRecursion(self):
+        """
+        This method finds symbols that left-recurse (directly or through other symbols) by
+        running Tarjan's strongly-connected-components algorithm over the graph of leftmost
+        tokens. Cycles that still have a non-recursive alternative terminate with probability
+        one, so they only get a warning; a cycle with no way out can never produce a leftmost
+        terminal, so it raises before generate() can descend forever
+
+        Raises
+        ------
+        ValueError
+            if some cycle of symbols has no alternative leading out of the cycle
+        """
+        leftEdges = {}
+        for symbol, rule in self.langMap.items():
+            leftEdges[symbol] = {alt[0] for alt in rule if alt and alt[0] in self.langMap}
+        index = {}
+        low = {}
+        onStack = set()
+        sccStack = []
+        counter = 0
+        recursive = []
+        for root in leftEdges:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            sccStack.append(root)
+            onStack.add(root)
+            work = [(root, iter(leftEdges[root]))]
+            while work:
+                node, edges = work[-1]
+                descended = False
+                for nxt in edges:
+                    if nxt not in index:
+                        index[nxt] = low[nxt] = counter
+                        counter += 1
+                        sccStack.append(nxt)
+                        onStack.add(nxt)
+                        work.append((nxt, iter(leftEdges[nxt])))
+                        descended = True
+                        break
+                    elif nxt in onStack:
+                        low[node] = min(low[node], index[nxt])
+                if descended:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    scc = []
+                    while True:
+                        member = sccStack.pop()
+                        onStack.discard(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    if len(scc) > 1 or node in leftEdges[node]:
+                        recursive.append(scc)
+        for scc in recursive:
+            members = set(scc)
+            symbols = ', '.join(sorted(scc))
+            if all(self.langMap[s] and all(alt and alt[0] in members for alt in self.langMap[s]) for s in scc):
+                raise ValueError("Left recursion with no exit in: " + symbols)
+            print("!WARNING: Left recursion in: " + symbols)
+
+    def _compile(self):
+        """
+        This method compiles langMap into an int-indexed table so generate() can expand
+        symbols with array indexing instead of string hashing. Symbols get ids >= 0 into
+        _rules and terminals get negative ids into _terminals, where id -1 is _terminals[0]
+        """
+        self._symId = {symbol: symId for symId, symbol in enumerate(self.langMap)}
+        self._terminals = []
+        termId = {}
+        def encodeTerminal(token):
+            tokId = termId.get(token)
+            if tokId is None:
+                tokId = -len(self._terminals) - 1
+                termId[token] = tokId
+                self._terminals.append(token)
+            return tokId
+        def encode(token):
+            symId = self._symId.get(token)
+            return symId if symId is not None else encodeTerminal(token)
+        self._rules = [[[encode(token) for token in alt] for alt in rule] for rule in self.langMap.values()]
+        self._symNameId = [encodeTerminal(symbol) for symbol in self.langMap]
+        if np is not None:
+            ruleAltStart = [0]
+            altStart = [0]
+            flatTokens = []
+            for rule in self._rules:
+                for alt in rule:
+                    flatTokens.extend(alt)
+                    altStart.append(len(flatTokens))
+                ruleAltStart.append(len(altStart) - 1)
+            self._ruleAltStart = np.asarray(ruleAltStart, np.int64)
+            self._altStart = np.asarray(altStart, np.int64)
+            self._ruleTokens = np.asarray(flatTokens or [0], np.int64)
+            self._symNameIds = np.asarray(self._symNameId or [0], np.int64)
+        self._rngBuf = {}
+        self._rngIdx = {}
+
+    def _nextAlt(self, symId, altCount):
+        """
+        This method returns the next pre-drawn alternative index for a symbol. With numpy
+        installed, indices are drawn 4096 at a time into a per-symbol buffer so the RNG cost
+        is paid in one vectorized call instead of once per expansion; the buffers are
+        discarded whenever the grammar is recompiled
+        """
+        if np is None:
+            return random.randrange(altCount)
+        idx = self._rngIdx.get(symId, 0)
+        buf = self._rngBuf.get(symId)
+        if buf is None or idx >= len(buf):
+            buf = np.random.randint(0, altCount, size=4096)
+            self._rngBuf[symId] = buf
+            idx = 0
+        self._rngIdx[symId] = idx + 1
+        return buf[idx]
+
+    def _generate_fast(self, symId):
+        """
+        This method is the int-domain expansion loop behind generate(). It walks the
+        compiled _rules table with an explicit stack and only touches strings once at
+        the end, when the collected terminal ids are joined
+        """
+        rules = self._rules
+        symNameId = self._symNameId
+        nextAlt = self._nextAlt
+        stack = [symId]
+        out = []
+        while stack:
+            tokId = stack.pop()
+            if tokId < 0:
+                out.append(tokId)
+                continue
+            rule = rules[tokId]
+            if not rule:
+                out.append(symNameId[tokId])
+                continue
+            for part in reversed(rule[nextAlt(tokId, len(rule))]):
+                stack.append(part)
+        terminals = self._terminals
+        return ' '.join(terminals[-i-1] for i in out)
+
+    def generateBulk(self, symbol, count):
+        """
+        This method generates many expressions for a given symbol in one call. When numpy
+        and numba are installed, expansion runs inside a JIT-compiled kernel over flattened
+        rule arrays; otherwise it falls back to calling generate() once per expression
+        ...
+
+        Parameters
+        ----------
+        symbol : str
+            this is the symbol that will be substituted with randomly selected expressions
+        count : int
+            this is how many expressions will be generated
+
+        Returns
+        -------
+        terms : str[]
+            the generated expressions as a list
+        """
+        if _expandCompiled is None or symbol not in self.langMap or self._isTerminalRule.get(symbol):
+            return [self.generate(symbol) for _ in range(count)]
+        symId = self._symId[symbol]
+        terminals = self._terminals
+        ruleAltStart = self._ruleAltStart
+        altStart = self._altStart
+        ruleTokens = self._ruleTokens
+        symNameIds = self._symNameIds
+        outBuf = np.empty(1024, np.int64)
+        terms = []
+        for _ in range(count):
+            n = _expandCompiled(symId, ruleAltStart, altStart, ruleTokens, symNameIds, outBuf)
+            while n < 0:
+                outBuf = np.empty(outBuf.shape[0] * 2, np.int64)
+                n = _expandCompiled(symId, ruleAltStart, altStart, ruleTokens, symNameIds, outBuf)
+            terms.append(' '.join(terminals[-i-1] for i in outBuf[:n]))
+        return terms
+
+    def _buildTerminalCache(self):
+        """
+        This method precomputes which symbols expand to terminals only, pre-joining their
+        alternatives so generate() can return them without any splitting or stack work. It
+        also rebuilds the reverse expression index behind contains() so alternatives that
+        were replaced by a mutation stop reporting as present
+        """
+        self._isTerminalRule = {}
+        self._terminalCache = {}
+        self._exprIndex = set()
+        for symbol, rule in self.langMap.items():
+            self._exprIndex.update(' '.join(alt) for alt in rule)
+            if rule and all(all(token not in self.langMap for token in alt) for alt in rule):
+                self._isTerminalRule[symbol] = True
+                self._terminalCache[symbol] = [' '.join(alt) for alt in rule]
+            else:
+                self._isTerminalRule[symbol] = False
+
+    def generate(self, symbol):
+        """
+        This method generates an expression based upon a given symbol. 
+        Returns "Symbol not found in grammar" if the given symbol is not found within the grammar
+        ...
+
+        Parameters
+        ----------
+        symbol : str
+            this is the symbol that will be substituted with a randomly selected expression
+
+        Returns
+        -------
+        term : str
+            this is the expresssion that was generated for the symbol
+        """
+        rule = self.langMap.get(symbol)
+        if rule is None:
+            return "Symbol not found in grammar: " + symbol
+        if not rule:
+            return symbol # leave symbols with no expressions unexpanded
+        if self._isTerminalRule.get(symbol):
+            cached = self._terminalCache[symbol]
+            return cached[self._nextAlt(self._symId[symbol], len(cached))]
+        return self._generate_fast(self._symId[symbol])
+
+    def contains(self, term):
+        """
+        This method checks whether or not a term is a symbol. If the term is not a symbol, all of the 
+        expressions of each symbol are checked
+        ...
+
+        Parameters
+        ----------
+        term : str
+            this is the given term to be searched. Can be a symbol or expression
+
+        Returns
+        -------
+        bool
+            an unnamed boolean value representing whether or not the term was found within the grammar
+        """
+        return term in self.langMap or term in self._exprIndex
+
+    def addSymbol(self, symbol):
+        """
+        This method checks whether or not a given symbol is within the grammar. If not, the symbol is added
+        ...
+
+        Parameters
+        ----------
+        symbol : str
+            this is the symbol to be added
+        """
+        self.langMap[sys.intern(symbol)] = []
+        self._buildTerminalCache()
+        self._compile()
+
+    def addExpression(self, symbol, expression):
+        """
+        This method checks whether or not a given expression is found for the given symbol. If not,
+        the symbol is defined as the expression and is saved into the grammar
+        ...
+
+        Parameters
+        ----------
+        symbol : str
+            this is the symbol in which the expression is to be added under
+        expression : str
+            this is the expression to be added 
+        """
+        tokens = [sys.intern(token) for token in expression.split(' ')]
+        if symbol in self.langMap:
+            self.langMap[symbol].append(tokens)
+        else:
+            self.langMap[sys.intern(symbol)] = [tokens]
+        self._buildTerminalCache()
+        self._compile()
+
+    def saveMap(self, filename='BNF Forms/grammar.txt'):
+        """
+        This method allows the grammar to be saved in a text file with each line constituting a symbol defintion
+        ...
+
+        Parameters
+        ----------
+        filename : str
+            the filename that the grammar will be saved as        
+        """
+        if not filename.endswith('.txt'):
+            filename += '.txt'
+        symDelim = self.symDelim
+        exprDelim = self.exprDelim
+        lines = [f"{k}{symDelim}{exprDelim.join(' '.join(alt) for alt in v)}" for k, v in self.langMap.items()]
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write(''.join(f"{line}\n" for line in lines))
+
+    def updateMap(self, filename):
+        if not filename.endswith('.txt'):
+            filename += '.txt'    
+        with open(filename, 'r', encoding='utf-8') as file:
+            for rule in file:
+                symbol, expressions = rule.split(self.symDelim, 1)
+                alternatives = expressions.rstrip('\n').split(self.exprDelim)
+                self.langMap[sys.intern(symbol.strip())] = [[sys.intern(token) for token in alt.split(' ')] for alt in alternatives]
+        self._buildTerminalCache()
+        self._compile()
+
+def main():
+    try:
+        gb = GrammarBuddyHelper.fromFile("BNF Forms/math.txt") # Constructing GrammarBuddyHelper object
+    except FileNotFoundError as e:
+        print(f"Uh oh\n{e}")
+        gb = GrammarBuddyHelper([])
+
+    gb.addExpression('<x>','<s>') # Adding sample expression
+    for i, expr in enumerate(gb.generateBulk('<expression>', 100)): # Generate 100 sample expressions
+        print(f"{i+1}: {expr}")
+    gb.saveMap("BNF Forms/testgrammar.txt") # Saving updated grammar
+
+if __name__ == "__main__":
+    gb = None
+    start = pyip.inputYesNo("Would you like to load a grammar file? Press ENTER to exit\n", blank=True)
+    if start == 'yes':
+        while gb is None:
+            filename = input("Path of grammar file? Press ENTER to skip\n")
+            if not filename:
+                break
+            try:
+                gb = GrammarBuddyHelper.fromFile(filename)
+            except FileNotFoundError as e:
+                print(f"Uh oh \n{e}\n")
+    elif not start:
+        sys.exit()
+    if gb is None:
+        gb = GrammarBuddyHelper([])
+    flag = True
+    while flag:
+        choice = pyip.inputMenu(['Generate a symbol', 'Generate a number of symbols', 'List symbols', 'Add a symbol', 'Add an expression', 'Does it contain?', 'Open a grammar text file', 'Save grammar to a text file', 'Exit'], numbered=True)
+
+        match choice:
+            case 'Generate a symbol':
+                if 0 == len(gb.langMap.keys()): 
+                    print("Cannot generate a big nothing symbol!")
+                    continue
+                print("Press ENTER to skip")
+                choice = pyip.inputMenu(list(gb.langMap.keys()), numbered=True, blank=True)
+                print(gb.generate(choice))
+            case 'Generate a number of symbols':
+                if 0 == len(gb.langMap.keys()):
+                    print("Cannot generate multiple big nothing symbols!")
+                    continue
+                symbol = pyip.inputMenu(list(gb.langMap.keys()), prompt="Which symbol would you like to generate? Press ENTER to exit\n", blank=True, numbered=True)
+                if symbol: 
+                    print(f"How many {symbol}'s would you like to print?")
+                    symbols = pyip.inputNum(greaterThan=-1)
+                    for i in range(symbols):
+                        print(f"{i+1}: {gb.generate(symbol)}")
+            case 'List symbols':
+                for i in gb.langMap.keys():
+                    print(i)
+            case 'Add a symbol':
+                symbol = input("What symbol would you like to add?\n")
+                gb.addSymbol(symbol)
+            case 'Add an expression':
+                symbol = input("What symbol does this expression define?\n")
+                expression = input("What is the expression?\n")
+                gb.addExpression(symbol=symbol, expression=expression)
+            case 'Does it contain?':
+                term = input("What term would you like to check?\n")
+                print(gb.contains(term))
+            case 'Open a grammar text file':
+                filename = input("What is the name of the text file you would like to open? Press ENTER to exit\n")
+                if filename:
+                    try:
+                        gb.updateMap(filename)
+                    except Exception as e:
+                        print(f'Uh oh\n{e}')
+            case 'Save grammar to a text file':
+                filename = input("What name would you like to save the file as? Press ENTER to exit\n")
+                if filename:
+                    try:
+                        gb.saveMap(filename)
+                    except Exception as e:
+                        print(f'Uh oh \n{e}')
+            case 'Exit':
+                flag = False